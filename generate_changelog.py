@@ -2,6 +2,7 @@
 """Main script to generate and publish changelogs from GitLab milestones."""
 
 import argparse
+import functools
 import sys
 from datetime import datetime
 
@@ -10,6 +11,13 @@ from src.changelog_generator import ChangelogGenerator
 from src.gitlab_client import GitLabClient
 from src.slack_publisher import SlackPublisher
 
+
+@functools.lru_cache(maxsize=256)
+def _parse_iso(date_str):
+    """Parse an ISO date string once; repeated dates hit the cache."""
+    return datetime.fromisoformat(date_str) if date_str else None
+
+
 def main():
     """Main execution function."""
     parser = argparse.ArgumentParser(
@@ -96,8 +104,8 @@ def main():
         generator = ChangelogGenerator(repos_to_products)
 
         # Parse dates
-        start_date = datetime.fromisoformat(milestone.start_date) if milestone.start_date else None
-        due_date = datetime.fromisoformat(milestone.due_date) if milestone.due_date else None
+        start_date = _parse_iso(milestone.start_date)
+        due_date = _parse_iso(milestone.due_date)
 
         # Append to year-based changelog file (e.g., 2025.md)
         # Automatically prevents duplicates and organizes by year
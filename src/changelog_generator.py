@@ -1,12 +1,33 @@
 """Changelog generator that processes issues and formats output."""
 
+import functools
+import io
 import os
-from collections import defaultdict
+import re
 from datetime import datetime
+from operator import itemgetter
 from typing import List, Dict
 
 from src import config
 
+# Precompiled once at import - matches a four-digit year in a milestone name
+_YEAR_IN_NAME_RE = re.compile(r'(\d{4})')
+
+# Pre-bound getters for the footer statistics sum
+_get_time_stats = itemgetter('time_stats')
+_get_time_estimate = itemgetter('time_estimate')
+
+
+@functools.lru_cache(maxsize=64)
+def _milestone_entry_pattern(milestone_name):
+    """Compiled pattern matching a full changelog entry for one milestone."""
+    # From "**Changelog - {name}**" to the next "**Changelog -" or end of file
+    return re.compile(
+        r'\*\*Changelog - ' + re.escape(milestone_name) + r'\*\*.*?'
+        r'(?=\n\*\*Changelog - |\Z)',
+        re.DOTALL
+    )
+
 
 class ChangelogGenerator:
     """Generates formatted changelogs from GitLab issue data."""
@@ -28,17 +49,19 @@ class ChangelogGenerator:
         Returns:
             Dictionary with product names as keys and issue lists as values
         """
-        grouped = defaultdict(list)
-
+        # Bind the mapping lookup locally - this loop is pure-Python bound
+        # for large issue lists
+        grouped = {}
+        get_product = self.repos_to_products.get
         for issue in issues:
-            project_url = issue['project_url']
-            product = self.repos_to_products.get(project_url)
-            if not product:
-                # If no repository match found, add to Uncategorized
-                grouped['Uncategorized'].append(issue)
-                continue
-            grouped[product].append(issue)
-        return dict(grouped)
+            # If no repository match found, add to Uncategorized
+            product = get_product(issue['project_url']) or 'Uncategorized'
+            issue_list = grouped.get(product)
+            if issue_list is None:
+                grouped[product] = [issue]
+            else:
+                issue_list.append(issue)
+        return grouped
 
     def format_issue_line(self, issue: Dict) -> str:
         """
@@ -50,17 +73,14 @@ class ChangelogGenerator:
         Returns:
             Formatted string with title, repository, issue number, and labels
         """
-        # Extract only non-alias labels (not starting with @)
-        labels = [l for l in issue['labels'] if not l.startswith('@')]
-
-        # Get project name from issue data
-        project_name = issue.get('project_name', 'unknown')
+        # Join non-alias labels (not starting with @) in a single pass,
+        # without materializing an intermediate list
+        labels_str = ', '.join(l for l in issue['labels'] if l[:1] != '@')
 
         # Format: * Title (repository#123) (label1, label2)
-        issue_ref = f"{project_name}#{issue['iid']}"
+        issue_ref = f"{issue.get('project_name', 'unknown')}#{issue['iid']}"
 
-        if labels:
-            labels_str = ', '.join(labels)
+        if labels_str:
             return f"* {issue['title']} ({issue_ref}) ({labels_str})"
         else:
             return f"* {issue['title']} ({issue_ref})"
@@ -84,58 +104,77 @@ class ChangelogGenerator:
         Returns:
             Formatted changelog as string
         """
+        buf = io.StringIO()
+        self._write_changelog(buf, milestone_name, milestone_dates, issues, merge_requests)
+        return buf.getvalue()
+
+    def _write_changelog(
+        self,
+        fp,
+        milestone_name: str,
+        milestone_dates: tuple,
+        issues: List[Dict],
+        merge_requests: List[Dict] = None
+    ) -> None:
+        """
+        Write the changelog piece by piece to any file-like object.
+
+        Streaming to the target avoids holding a second full copy of the
+        changelog in memory when writing directly to a file.
+        """
+        write = fp.write
         start_date, due_date = milestone_dates
 
         # Format dates
         start_str = start_date.strftime('%Y-%m-%d') if start_date else 'N/A'
         due_str = due_date.strftime('%Y-%m-%d') if due_date else 'N/A'
 
-        # Build changelog header
-        changelog = f"**Changelog - {milestone_name}** ({start_str} → {due_str})\n\n"
+        write(f"**Changelog - {milestone_name}** ({start_str} → {due_str})\n\n")
 
         # Group issues by product
         grouped_issues = self.group_issues_by_product(issues)
 
         # Sort products (Uncategorized at the end)
         sorted_products = sorted(
-            grouped_issues.keys(),
-            key=lambda x: (x == 'Uncategorized', x)
+            grouped_issues.items(),
+            key=lambda item: (item[0] == 'Uncategorized', item[0])
         )
 
         # Format each product section
-        for product in sorted_products:
-            product_issues = grouped_issues[product]
-            changelog += f"**{product}** ({len(product_issues)} issues)\n"
+        for product, product_issues in sorted_products:
+            write(f"**{product}** ({len(product_issues)} issues)\n")
 
-            # Sort issues alphabetically by title
-            sorted_issues = sorted(product_issues, key=lambda x: x['title'].lower())
+            # Sort issues alphabetically by title - decorate-sort-undecorate,
+            # so lower() runs once per issue rather than per comparison
+            decorated = [
+                (issue['title'].lower(), index, issue)
+                for index, issue in enumerate(product_issues)
+            ]
+            decorated.sort()
 
-            for issue in sorted_issues:
-                changelog += self.format_issue_line(issue) + "\n"
+            for _, _, issue in decorated:
+                write(self.format_issue_line(issue))
+                write("\n")
 
-            changelog += "\n"
+            write("\n")
 
         # Add footer with statistics
         total_issues = len(issues)
-        total_time_estimate = sum(
-            issue['time_stats']['time_estimate'] for issue in issues
-        )
+        total_time_estimate = sum(map(_get_time_estimate, map(_get_time_stats, issues)))
 
         # Convert seconds to hours and days
         # GitLab uses 8 hours as 1 working day by default
         est_hours = total_time_estimate / 3600 if total_time_estimate else 0
         est_days = est_hours / 8 if est_hours > 0 else 0
 
-        changelog += "---\n"
-        changelog += f"Total: {total_issues} issues closed"
+        write("---\n")
+        write(f"Total: {total_issues} issues closed")
 
         if est_hours > 0:
             # Show both hours and days
-            changelog += f" | Estimated: {est_hours:.1f}h ({est_days:.1f}d)"
-
-        changelog += "\n"
+            write(f" | Estimated: {est_hours:.1f}h ({est_days:.1f}d)")
 
-        return changelog
+        write("\n")
 
     def generate_markdown_file(
         self,
@@ -155,15 +194,11 @@ class ChangelogGenerator:
             output_file: Path to output markdown file
             merge_requests: Optional list of merge request dictionaries
         """
-        changelog = self.generate_changelog(
-            milestone_name,
-            milestone_dates,
-            issues,
-            merge_requests
-        )
-
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(changelog)
+        # Stream sections straight to the file instead of materializing
+        # the whole changelog string first; a 1 MiB buffer keeps even large
+        # changelogs to a single write syscall
+        with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            self._write_changelog(f, milestone_name, milestone_dates, issues, merge_requests)
 
     def append_to_year_changelog(
         self,
@@ -184,8 +219,6 @@ class ChangelogGenerator:
             archive_dir: Directory to store year-based changelogs (default: 'changelog_archive')
             merge_requests: Optional list of merge request dictionaries
         """
-        import re
-
         # Extract year from milestone dates (use due_date or start_date)
         start_date, due_date = milestone_dates
         milestone_year = None
@@ -196,7 +229,7 @@ class ChangelogGenerator:
             milestone_year = start_date.year
         else:
             # Try to extract year from milestone name (e.g., "09/10/2025")
-            year_match = re.search(r'(\d{4})', milestone_name)
+            year_match = _YEAR_IN_NAME_RE.search(milestone_name)
             if year_match:
                 milestone_year = int(year_match.group(1))
             else:
@@ -220,42 +253,40 @@ class ChangelogGenerator:
         current_time = datetime.now()
         new_entry += f"\n---\n*Generated on {current_time.strftime('%Y-%m-%d %H:%M:%S')}*\n\n"
 
-        # Read existing year file if it exists
-        existing_content = ""
-        if os.path.exists(year_file):
-            with open(year_file, 'r', encoding='utf-8') as f:
-                existing_content = f.read()
-
-        # Check if this milestone already exists in the file
-        milestone_pattern = re.escape(f"**Changelog - {milestone_name}**")
-        milestone_exists = re.search(milestone_pattern, existing_content)
+        # Read existing year file if it exists; opening directly saves the
+        # stat call, and rb + one decode skips the TextIOWrapper overhead
+        try:
+            with open(year_file, 'rb') as f:
+                existing_content = f.read().decode('utf-8')
+        except FileNotFoundError:
+            existing_content = ""
+
+        # Check if this milestone already exists in the file; a literal
+        # substring scan beats running the regex engine over the whole file,
+        # and an empty file short-circuits straight to the prepend branch
+        milestone_exists = (
+            bool(existing_content)
+            and f"**Changelog - {milestone_name}**" in existing_content
+        )
 
         if milestone_exists:
             # Replace existing milestone entry
-            # Find the section for this milestone (from header to next header or separator)
-            # Pattern: from "**Changelog - {name}**" to next "**Changelog -" or end of file
-            pattern = (
-                r'\*\*Changelog - ' + re.escape(milestone_name) + r'\*\*.*?'
-                r'(?=\n\*\*Changelog - |\Z)'
-            )
-            existing_content = re.sub(
-                pattern,
+            # (the compiled pattern is cached per milestone name)
+            existing_content = _milestone_entry_pattern(milestone_name).sub(
                 new_entry.rstrip() + '\n\n',
-                existing_content,
-                flags=re.DOTALL
+                existing_content
             )
 
-            # Write updated content
-            with open(year_file, 'w', encoding='utf-8') as f:
-                f.write(existing_content)
+            # Write updated content as one pre-encoded block, bypassing the
+            # TextIOWrapper chunked-encode path
+            with open(year_file, 'wb') as f:
+                f.write(existing_content.encode('utf-8'))
 
             print(f"Updated existing milestone '{milestone_name}' in {year_file}")
         else:
-            # Add new entry at the top
-            with open(year_file, 'w', encoding='utf-8') as f:
-                f.write(new_entry)
-                if existing_content:
-                    f.write(existing_content)
+            # Add new entry at the top, written in a single pre-encoded call
+            with open(year_file, 'wb') as f:
+                f.write((new_entry + existing_content if existing_content else new_entry).encode('utf-8'))
 
             print(f"Added new milestone '{milestone_name}' to {year_file}")
 
@@ -304,71 +335,47 @@ class ChangelogGenerator:
             # Create archive directory if it doesn't exist
             os.makedirs(archive_dir, exist_ok=True)
 
-            # Parse the existing changelog to find entries from previous years
-            # Look for year patterns in the content
-            lines = existing_content.split('\n')
-            current_year_content = []
+            # Split into per-milestone blocks on the entry header; the leading
+            # newline keeps a header at position 0 from being swallowed, and
+            # blocks[0] is any preamble before the first entry
+            blocks = ('\n' + existing_content).split('\n**Changelog - ')
+            current_year_blocks = [blocks[0]] if blocks[0].strip() else []
             archive_entries_by_year = {}
-            current_entry_year = None
-            current_entry_lines = []
-
-            for line in lines:
-                # Look for date patterns like "2024-10-01" or "Generated on 2024-"
-                if '202' in line or '201' in line:  # Basic year detection
-                    # Try to extract year from the line
-                    import re
-                    year_match = re.search(r'(20\d{2})', line)
-                    if year_match:
-                        detected_year = int(year_match.group(1))
-                        if current_entry_year != detected_year:
-                            # Save previous entry if exists
-                            if current_entry_year and current_entry_lines:
-                                if current_entry_year == current_year:
-                                    current_year_content.extend(current_entry_lines)
-                                else:
-                                    if current_entry_year not in archive_entries_by_year:
-                                        archive_entries_by_year[current_entry_year] = []
-                                    archive_entries_by_year[current_entry_year].extend(current_entry_lines)
-                            current_entry_year = detected_year
-                            current_entry_lines = [line]
-                        else:
-                            current_entry_lines.append(line)
-                    else:
-                        current_entry_lines.append(line)
-                else:
-                    current_entry_lines.append(line)
 
-            # Save the last entry
-            if current_entry_year and current_entry_lines:
-                if current_entry_year == current_year:
-                    current_year_content.extend(current_entry_lines)
+            for block in blocks[1:]:
+                block = '**Changelog - ' + block
+                # The generator's own timestamp line is the authoritative
+                # year; slice it out directly - no regex needed
+                ts_idx = block.rfind('*Generated on ')
+                year_text = block[ts_idx + 14:ts_idx + 18] if ts_idx != -1 else ''
+                block_year = int(year_text) if year_text.isdigit() else current_year
+
+                if block_year == current_year:
+                    current_year_blocks.append(block)
                 else:
-                    if current_entry_year not in archive_entries_by_year:
-                        archive_entries_by_year[current_entry_year] = []
-                    archive_entries_by_year[current_entry_year].extend(current_entry_lines)
+                    archive_entries_by_year.setdefault(block_year, []).append(block)
 
             # Write archived entries to their respective year files (prepend to top)
-            for year, year_lines in archive_entries_by_year.items():
+            for year, year_blocks in archive_entries_by_year.items():
                 year_file = os.path.join(archive_dir, f"{year}.md")
-                year_content = '\n'.join(year_lines).strip()
+                year_content = '\n'.join(year_blocks).strip()
 
-                # Read existing year file if it exists
-                existing_year_content = ""
-                if os.path.exists(year_file):
-                    with open(year_file, 'r', encoding='utf-8') as f:
+                # Single open per file: read existing content, rewind, write merged
+                try:
+                    with open(year_file, 'r+', encoding='utf-8') as f:
                         existing_year_content = f.read()
-
-                # Write to year file (new content at top)
-                with open(year_file, 'w', encoding='utf-8') as f:
-                    f.write(year_content)
-                    if existing_year_content and not existing_year_content in year_content:
-                        f.write("\n\n" + existing_year_content)
+                        if existing_year_content and existing_year_content not in year_content:
+                            year_content += "\n\n" + existing_year_content
+                        f.seek(0)
+                        f.write(year_content)
+                        f.truncate()
+                except FileNotFoundError:
+                    with open(year_file, 'w', encoding='utf-8') as f:
+                        f.write(year_content)
 
             # Keep only current year entries in the existing content
-            existing_content = '\n'.join(current_year_content).strip()
+            existing_content = '\n'.join(current_year_blocks).strip()
 
-        # Write new entry at the top
+        # Write new entry at the top in a single call
         with open(changelog_file, 'w', encoding='utf-8') as f:
-            f.write(new_entry)
-            if existing_content:
-                f.write("\n" + existing_content)
+            f.write(new_entry + "\n" + existing_content if existing_content else new_entry)
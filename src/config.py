@@ -20,13 +20,16 @@ PRODUCT = {
     'ProductLabel3': PRODUCT_3
 }
 
+# Derived once at import time - both are pure functions of the constants above
+REPOS_TO_PRODUCTS = {
+    f'{BASE_URL}/{repo}': product_name
+    for product_name, repos in PRODUCT.items()
+    for repo in repos
+}
+# Each URL is unique, so the mapping keys already are the flat URL list
+ALL_REPOSITORIES = list(REPOS_TO_PRODUCTS)
+
+
 def get_repositories():
-    all_repositories = []
-    repos_to_products = {}
-    for product_name, product_url in PRODUCT.items():
-        for repo in product_url:
-            _project_url = f'{BASE_URL}/{repo}'
-            repos_to_products[_project_url] = product_name
-            all_repositories.append(_project_url)
-    return all_repositories, repos_to_products
+    return ALL_REPOSITORIES, REPOS_TO_PRODUCTS
 
@@ -1,8 +1,13 @@
 """GitLab API client for fetching milestone and issue data."""
 
 import gitlab
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Optional, Union
 
+# GitLab defaults to 20 items per page; 100 is the API maximum and cuts
+# the number of round-trips for paginated listings by 5x
+GITLAB_PER_PAGE = 100
+
 
 class GitLabClient:
     """Client for interacting with GitLab API."""
@@ -19,6 +24,12 @@ class GitLabClient:
         self.gl = gitlab.Gitlab(url, private_token=token)
         self.group_id = group_id
         self.group = self.gl.groups.get(group_id)
+        # Lazy caches for paginated group listings (avoid re-fetching per lookup)
+        self._milestones = None
+        self._milestones_by_title = None
+        self._projects = None
+        # Project objects keyed by id, shared across issue lookups
+        self._project_cache = {}
 
     def get_milestone_by_name(self, milestone_name: str) -> Optional[object]:
         """
@@ -30,11 +41,11 @@ class GitLabClient:
         Returns:
             Milestone object or None if not found
         """
-        milestones = self.group.milestones.list(search=milestone_name, get_all=True)
-        for milestone in milestones:
-            if milestone.title == milestone_name:
-                return milestone
-        return None
+        if self._milestones_by_title is None:
+            if self._milestones is None:
+                self._milestones = self.group.milestones.list(per_page=GITLAB_PER_PAGE, get_all=True)
+            self._milestones_by_title = {m.title: m for m in self._milestones}
+        return self._milestones_by_title.get(milestone_name)
 
     def get_milestone_by_id(self, milestone_id: int) -> object:
         """
@@ -55,8 +66,18 @@ class GitLabClient:
         Returns:
             List of project objects
         """
-        projects = self.group.projects.list(get_all=True, include_subgroups=True)
-        return projects
+        if self._projects is None:
+            # Keyset pagination stays O(n) on the server for deep pages,
+            # unlike the default offset mode
+            self._projects = self.group.projects.list(
+                per_page=GITLAB_PER_PAGE,
+                pagination='keyset',
+                order_by='id',
+                sort='asc',
+                get_all=True,
+                include_subgroups=True
+            )
+        return self._projects
 
     def get_project_by_url(self, project_url: str) -> Optional[object]:
         """
@@ -87,13 +108,37 @@ class GitLabClient:
             print(f"Error parsing project URL {project_url}: {e}")
             return None
 
-    def get_closed_issues(self, milestone_title: str, project_urls: List[str]) -> List[Dict]:
+    def get_group_issues(self, milestone_title: str, state: str = 'closed') -> List[object]:
+        """
+        Get all issues for a group milestone in a single paginated query.
+
+        Args:
+            milestone_title: Milestone title (not ID - GitLab API requires the title for group milestones)
+            state: Issue state filter (default: 'closed')
+
+        Returns:
+            List of issue objects across all projects in the group
+        """
+        return self.group.issues.list(
+            milestone=milestone_title,
+            state=state,
+            per_page=GITLAB_PER_PAGE,
+            get_all=True
+        )
+
+    def get_closed_issues(
+        self,
+        milestone_title: str,
+        project_urls: List[str],
+        issues: Optional[List[object]] = None
+    ) -> List[Dict]:
         """
         Get all closed issues for a group milestone from specified repositories.
 
         Args:
             milestone_title: Milestone title (not ID - GitLab API requires the title for group milestones)
             project_urls: List of project URLs to filter issues from (for filtering results)
+            issues: Optional pre-fetched issue objects; when given, no group query is made
 
         Returns:
             List of issue dictionaries with relevant data
@@ -101,27 +146,81 @@ class GitLabClient:
         issue_data = []
 
         # Normalize project URLs for filtering
-        normalized_urls = set(url.rstrip('/') for url in project_urls)
+        normalized_urls = frozenset(url.rstrip('/') for url in project_urls)
 
         # Fetch issues directly from the group milestone
         # This is the correct way to get issues from a group milestone
         # IMPORTANT: GitLab API requires milestone TITLE (not ID) for group milestones
         try:
-            # Use the group's issues endpoint with milestone filter
-            issues = self.group.issues.list(
-                milestone=milestone_title,
-                state='closed',
-                get_all=True
-            )
+            # Use the group's issues endpoint with milestone filter,
+            # unless the caller already fetched them
+            if issues is None:
+                issues = self.get_group_issues(milestone_title)
 
             print(f"Found {len(issues)} closed issues in group milestone")
 
+            # Prime the project cache with one group listing so the per-issue
+            # lookups below avoid an HTTP round-trip per issue (N+1 pattern)
+            allowed_project_ids = None
+            try:
+                for project in self.get_projects_in_group():
+                    self._project_cache.setdefault(project.id, project)
+                # Project ids whose URL is configured - lets us drop issues
+                # from other projects before any metadata lookup
+                allowed_project_ids = {
+                    project_id for project_id, project in self._project_cache.items()
+                    if project.web_url.rstrip('/') in normalized_urls
+                }
+            except Exception as e:
+                print(f"Warning: Could not prefetch group projects: {e}")
+
+            # Fetch any projects still missing from the cache in parallel;
+            # the HTTP round-trips release the GIL so the calls overlap
+            # (max_workers=8 keeps us under GitLab's rate limits)
+            # Issues whose web_url carries the project prefix are resolved
+            # below without a project object, so don't prefetch for those
+            wanted_ids = {
+                issue.project_id for issue in issues
+                if '/-/issues/' not in issue.web_url
+            }
+            if allowed_project_ids is not None:
+                wanted_ids &= allowed_project_ids
+            missing_ids = [pid for pid in wanted_ids if pid not in self._project_cache]
+            if missing_ids:
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    futures = {
+                        executor.submit(self.gl.projects.get, pid): pid
+                        for pid in missing_ids
+                    }
+                    for future in as_completed(futures):
+                        project_id = futures[future]
+                        try:
+                            self._project_cache[project_id] = future.result()
+                        except Exception as e:
+                            print(f"Warning: Could not get project {project_id}: {e}")
+
             # Filter issues by project URL if project_urls is provided
             for issue in issues:
-                # Get the project for this issue
+                # Skip issues from unconfigured projects before fetching anything
+                if allowed_project_ids is not None and issue.project_id not in allowed_project_ids:
+                    continue
+                # Resolve the project URL and name without an extra round-trip:
+                # cached project first, then the issue's own web_url, and only
+                # then a projects.get call as a last resort
                 try:
-                    project = self.gl.projects.get(issue.project_id)
-                    project_url = project.web_url.rstrip('/')
+                    project = self._project_cache.get(issue.project_id)
+                    if project is not None:
+                        project_url = project.web_url.rstrip('/')
+                        project_name = project.name
+                    elif '/-/issues/' in issue.web_url:
+                        # Issue URLs look like {project_url}/-/issues/{iid}
+                        project_url = issue.web_url.rsplit('/-/issues/', 1)[0].rstrip('/')
+                        project_name = project_url.rsplit('/', 1)[-1]
+                    else:
+                        project = self.gl.projects.get(issue.project_id)
+                        self._project_cache[issue.project_id] = project
+                        project_url = project.web_url.rstrip('/')
+                        project_name = project.name
 
                     # Only include if the project is in our configured list
                     if project_url in normalized_urls:
@@ -130,8 +229,8 @@ class GitLabClient:
                             'title': issue.title,
                             'labels': issue.labels,
                             'web_url': issue.web_url,
-                            'project_name': project.name,
-                            'project_url': project.web_url,
+                            'project_name': project_name,
+                            'project_url': project_url,
                             'time_stats': {
                                 'time_estimate': issue.time_stats.get('time_estimate', 0),
                                 'total_time_spent': issue.time_stats.get('total_time_spent', 0)
@@ -159,6 +258,7 @@ class GitLabClient:
         merge_requests = self.project.mergerequests.list(
             milestone=str(milestone_id),
             state='merged',
+            per_page=GITLAB_PER_PAGE,
             get_all=True
         )
 
@@ -1,6 +1,10 @@
 """Slack publisher for posting changelogs to Slack channels."""
 
+import json
+
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter, Retry
 from typing import Optional
 
 
@@ -18,6 +22,22 @@ class SlackPublisher:
         self.webhook_url = webhook_url
         self.channel = channel
 
+        # Headers built once; requests would otherwise rebuild them per post
+        self._headers = {'Content-Type': 'application/json'}
+
+        # One session shared across posts: TLS handshake and TCP setup are
+        # paid once, multi-chunk publishes reuse the connection
+        self._session = requests.Session()
+        self._session.mount('https://', HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        ))
+
     def _chunk_message(self, text: str, max_length: int = 3900) -> list:
         """
         Split message into chunks if it exceeds Slack's size limit.
@@ -55,13 +75,58 @@ class SlackPublisher:
 
         return chunks
 
-    def publish(self, changelog_text: str, dry_run: bool = False) -> bool:
+    def _post_chunk(self, index: int, chunk: str, total: int) -> bool:
+        """
+        Post a single message chunk to the webhook.
+
+        Args:
+            index: Zero-based position of the chunk
+            chunk: Chunk text
+            total: Total number of chunks in the message
+
+        Returns:
+            True if successful, False otherwise
+        """
+        payload = {"text": chunk}
+
+        if self.channel:
+            payload["channel"] = self.channel
+
+        # Add part indicator for multi-part messages
+        if total > 1:
+            payload["text"] = f"[Part {index+1}/{total}]\n\n{chunk}"
+
+        try:
+            # Serialize once and send raw bytes; the json= path re-derives
+            # headers and encodes on every call
+            body = json.dumps(payload).encode('utf-8')
+            response = self._session.post(
+                self.webhook_url,
+                data=body,
+                headers=self._headers,
+                timeout=10
+            )
+            response.raise_for_status()
+
+            if response.text != "ok":
+                print(f"Unexpected response from Slack: {response.text}")
+                return False
+
+        except requests.exceptions.RequestException as e:
+            print(f"Error posting to Slack: {e}")
+            return False
+
+        return True
+
+    def publish(self, changelog_text: str, dry_run: bool = False, ordered: bool = True) -> bool:
         """
         Publish changelog to Slack.
 
         Args:
             changelog_text: Formatted changelog text
             dry_run: If True, print to console instead of sending
+            ordered: If True (default), post chunks sequentially so parts
+                arrive in order; if False, post them concurrently
 
         Returns:
             True if successful, False otherwise
@@ -74,34 +139,24 @@ class SlackPublisher:
 
         # Split into chunks if needed
         chunks = self._chunk_message(changelog_text)
+        total = len(chunks)
 
-        for i, chunk in enumerate(chunks):
-            payload = {"text": chunk}
-
-            if self.channel:
-                payload["channel"] = self.channel
-
-            # Add part indicator for multi-part messages
-            if len(chunks) > 1:
-                payload["text"] = f"[Part {i+1}/{len(chunks)}]\n\n{chunk}"
-
-            try:
-                response = requests.post(
-                    self.webhook_url,
-                    json=payload,
-                    timeout=10
+        if ordered or total == 1:
+            for i, chunk in enumerate(chunks):
+                if not self._post_chunk(i, chunk, total):
+                    return False
+        else:
+            # Slack webhooks tolerate concurrent posts; without the ordering
+            # constraint the publish takes one round-trip instead of N
+            with ThreadPoolExecutor(max_workers=min(total, 4)) as executor:
+                results = executor.map(
+                    lambda args: self._post_chunk(args[0], args[1], total),
+                    enumerate(chunks)
                 )
-                response.raise_for_status()
-
-                if response.text != "ok":
-                    print(f"Unexpected response from Slack: {response.text}")
+                if not all(results):
                     return False
 
-            except requests.exceptions.RequestException as e:
-                print(f"Error posting to Slack: {e}")
-                return False
-
-        print(f"Successfully posted changelog to Slack ({len(chunks)} message(s))")
+        print(f"Successfully posted changelog to Slack ({total} message(s))")
         return True
 
     def publish_from_file(self, file_path: str, dry_run: bool = False) -> bool: